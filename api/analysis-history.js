@@ -39,8 +39,10 @@ export default async function handler(req, res) {
         console.log('Analysis History API called:', { method: req.method, query: req.query });
         
         // Get query parameters (for legacy history.js compatibility)
-        const limit = req.query.limit ? parseInt(req.query.limit) : 50;
-        const offset = req.query.offset ? parseInt(req.query.offset) : 0;
+        // Clamp pagination inputs so a malformed or hostile limit can't force
+        // an unbounded query
+        const limit = Math.min(Math.max(parseInt(req.query.limit) || 50, 1), 500);
+        const offset = Math.max(parseInt(req.query.offset) || 0, 0);
         const company = req.query.company;
         const verdict = req.query.verdict;
         const format = req.query.format || 'default'; // 'legacy' for old history.js format
@@ -293,11 +295,14 @@ export default async function handler(req, res) {
             };
         });
 
-        // Get summary stats
+        // Get summary stats in a single pass instead of three filter sweeps
         const total = analyses.length;
-        const highRisk = analyses.filter(a => a.ghostProbability >= 0.67).length;
-        const mediumRisk = analyses.filter(a => a.ghostProbability >= 0.34 && a.ghostProbability < 0.67).length;
-        const lowRisk = analyses.filter(a => a.ghostProbability < 0.34).length;
+        let highRisk = 0, mediumRisk = 0, lowRisk = 0;
+        for (const a of analyses) {
+            if (a.ghostProbability >= 0.67) highRisk++;
+            else if (a.ghostProbability >= 0.34) mediumRisk++;
+            else lowRisk++;
+        }
 
         console.log('Returning response:', {
             analysesCount: analyses.length,
@@ -1,16 +1,13 @@
 // Ghost Job Analysis with Direct WebLLM Integration
 // Fixed version that bypasses failing TypeScript imports
-import { PrismaClient } from '@prisma/client';
 import crypto from 'crypto';
+import { prisma } from '../lib/db.js';
 import { CompanyVerificationService } from '../lib/services/CompanyVerificationService.js';
 import { RepostingDetectionService } from '../lib/services/RepostingDetectionService.js';
 import { IndustryClassificationService } from '../lib/services/IndustryClassificationService.js';
 import { CompanyReputationService } from '../lib/services/CompanyReputationService.js';
 import { EngagementSignalService } from '../lib/services/EngagementSignalService.js';
 
-// Initialize Prisma directly to avoid import issues
-const prisma = new PrismaClient();
-
 export default async function handler(req, res) {
     const startTime = Date.now();
     
@@ -357,6 +354,9 @@ export default async function handler(req, res) {
             jobData.description || ''
         );
 
+        // Stamp the whole record with one timestamp so extractedAt and the
+        // source's addedAt can't disagree
+        const extractedAtIso = new Date().toISOString();
         const jobListing = await prisma.jobListing.create({
             data: {
                 sourceId: source.id,
@@ -374,7 +374,7 @@ export default async function handler(req, res) {
                     originalCompany: jobData.company,
                     originalDescription: jobData.description,
                     originalLocation: jobData.location,
-                    extractedAt: new Date().toISOString(),
+                    extractedAt: extractedAtIso,
                     // REMOVED: extractionMethod (now in separate field)
                     // REMOVED: parsingConfidence (now in separate field)
                     // REMOVED: platform (now in separate field) 
@@ -382,7 +382,7 @@ export default async function handler(req, res) {
                     sources: [{
                         url: url,
                         platform: extractPlatformFromUrl(url),
-                        addedAt: new Date().toISOString(),
+                        addedAt: extractedAtIso,
                         postedAt: jobData.postedAt || null
                     }]
                 },
@@ -440,27 +440,27 @@ export default async function handler(req, res) {
         // Create KeyFactor records to normalize reasonsJson data
         console.log('🔄 Creating KeyFactor records...');
         
-        // Create risk factor records
-        for (const factor of analysis.riskFactors) {
-            await prisma.keyFactor.create({
-                data: {
+        // Create risk factor records in one multi-row insert
+        if (analysis.riskFactors.length > 0) {
+            await prisma.keyFactor.createMany({
+                data: analysis.riskFactors.map(factor => ({
                     jobListingId: jobListing.id,
                     factorType: 'risk',
                     factorDescription: factor,
                     impactScore: 0.15 // Default medium impact
-                }
+                }))
             });
         }
         
-        // Create positive factor records
-        for (const factor of analysis.keyFactors) {
-            await prisma.keyFactor.create({
-                data: {
+        // Create positive factor records in one multi-row insert
+        if (analysis.keyFactors.length > 0) {
+            await prisma.keyFactor.createMany({
+                data: analysis.keyFactors.map(factor => ({
                     jobListingId: jobListing.id,
                     factorType: 'positive', 
                     factorDescription: factor,
                     impactScore: 0.10 // Default positive impact
-                }
+                }))
             });
         }
         
@@ -579,8 +579,6 @@ export default async function handler(req, res) {
             details: error.name,
             processingTimeMs: Date.now() - startTime
         });
-    } finally {
-        await prisma.$disconnect();
     }
 }
 
@@ -1,9 +1,7 @@
 // Ghost Job Detector - Production Health Check Endpoint
 // Phase 3: Comprehensive monitoring and system health validation
 
-import { PrismaClient } from '@prisma/client';
-
-const prisma = new PrismaClient();
+import { prisma } from '../lib/db.js';
 
 export default async function handler(req, res) {
   const startTime = Date.now();
@@ -248,8 +246,6 @@ export default async function handler(req, res) {
     };
 
     res.status(500).json(errorResponse);
-  } finally {
-    await prisma.$disconnect();
   }
 }
 
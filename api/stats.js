@@ -1,5 +1,11 @@
 import { prisma } from '../lib/db.js';
 
+// Short-TTL cache for the default stats payload. Stats aggregate seven
+// queries per hit but only change when new analyses land, so warm instances
+// can serve repeat dashboard requests without re-querying.
+const STATS_CACHE_TTL_MS = 60 * 1000;
+let statsCache = { payload: null, expiresAt: 0 };
+
 // Get analysis statistics from Postgres + Admin Dashboard
 export default async function handler(req, res) {
     if (req.method !== 'GET') {
@@ -19,6 +25,11 @@ export default async function handler(req, res) {
     }
 
     try {
+        // Serve from cache while fresh
+        if (statsCache.payload && Date.now() < statsCache.expiresAt) {
+            return res.status(200).json(statsCache.payload);
+        }
+
         // Get total analyses count
         const totalAnalyses = await prisma.analysis.count();
 
@@ -88,7 +99,7 @@ export default async function handler(req, res) {
             console.log('Queue stats not available:', error.message);
         }
 
-        return res.status(200).json({
+        const payload = {
             total_analyses: totalAnalyses,
             avg_ghost_probability: avgGhostProbability,
             risk_distribution: riskDistribution,
@@ -107,7 +118,11 @@ export default async function handler(req, res) {
                 version: '2.0',
                 model_version: process.env.ML_MODEL_VERSION || 'v1.0.0'
             }
-        });
+        };
+
+        statsCache = { payload, expiresAt: Date.now() + STATS_CACHE_TTL_MS };
+
+        return res.status(200).json(payload);
 
     } catch (error) {
         console.error('Stats fetch error:', error);
@@ -1,6 +1,4 @@
-const { PrismaClient } = require('@prisma/client')
-
-const prisma = new PrismaClient()
+import { prisma } from '../lib/db.js'
 
 /**
  * WebLLM Health Metrics API